@@ -11,6 +11,7 @@ from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
 from .api import ILexClient
 from .coordinator import ILexDataUpdateCoordinator
+from .scheduler import async_get_scheduler, async_release_scheduler
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -23,24 +24,38 @@ async def async_setup_entry(hass: HomeAssistant, entry: ILexConfigEntry) -> bool
     """Set up Syr Oceanic i-Lex Connect from a config entry."""
     _LOGGER.debug("Setting up Syr Oceanic i-Lex Connect integration")
     session = async_get_clientsession(hass)
+    scheduler = async_get_scheduler(hass, entry.entry_id)
     api = ILexClient(
         session=session,
         username=entry.data["username"],
         password=entry.data["password"],
+        scheduler=scheduler,
     )
 
-    # Perform initial authentication
-    _LOGGER.debug("Performing initial authentication")
-    await api.login()
-    _LOGGER.debug("Authentication successful")
+    coordinator = ILexDataUpdateCoordinator(hass, api, entry, scheduler)
+    try:
+        # Perform initial authentication
+        _LOGGER.debug("Performing initial authentication")
+        await api.login()
+        _LOGGER.debug("Authentication successful")
 
-    coordinator = ILexDataUpdateCoordinator(hass, api, entry)
-    _LOGGER.debug("Starting first coordinator refresh")
-    await coordinator.async_config_entry_first_refresh()
-    _LOGGER.debug("First refresh completed, setting up platforms")
-    entry.runtime_data = coordinator
+        _LOGGER.debug("Starting first coordinator refresh")
+        await coordinator.async_config_entry_first_refresh()
+        _LOGGER.debug("First refresh completed, setting up platforms")
+        entry.runtime_data = coordinator
 
-    await hass.config_entries.async_forward_entry_setups(entry, _PLATFORMS)
+        # Assign this entry a polling phase away from the other accounts. The
+        # first poll is scheduled when the platforms add their listeners.
+        coordinator.async_delay_next_refresh(
+            scheduler.async_register(entry.entry_id)
+        )
+
+        await hass.config_entries.async_forward_entry_setups(entry, _PLATFORMS)
+    except Exception:
+        # Drop this entry's hold so the shared scheduler does not outlive
+        # the last entry that actually uses it
+        async_release_scheduler(hass, entry.entry_id)
+        raise
     _LOGGER.debug("Syr Oceanic i-Lex Connect integration setup complete")
 
     return True
@@ -49,4 +64,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: ILexConfigEntry) -> bool
 async def async_unload_entry(hass: HomeAssistant, entry: ILexConfigEntry) -> bool:
     """Unload a config entry."""
     _LOGGER.debug("Unloading Syr Oceanic i-Lex Connect integration")
-    return await hass.config_entries.async_unload_platforms(entry, _PLATFORMS)
+    if unload_ok := await hass.config_entries.async_unload_platforms(
+        entry, _PLATFORMS
+    ):
+        async_release_scheduler(hass, entry.entry_id)
+    return unload_ok
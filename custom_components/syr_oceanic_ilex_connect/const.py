@@ -10,3 +10,27 @@ DEVICES_ENDPOINT = "/api/devices"
 FRENCH_DEGREE_HARDNESS = "°fH"
 
 DEFAULT_SCAN_INTERVAL = 30  # seconds
+
+# Shared budget for HTTP calls to the cloud host across all config entries,
+# including the logins made to renew an expired session
+MAX_CONCURRENT_REQUESTS = 2
+MAX_REQUESTS_PER_SECOND = 2
+
+# Events fired on transitions detected between update cycles
+EVENT_ILEX = f"{DOMAIN}_event"
+
+TRIGGER_ALARM_RAISED = "alarm_raised"
+TRIGGER_ALARM_CLEARED = "alarm_cleared"
+TRIGGER_REGENERATION_STARTED = "regeneration_started"
+TRIGGER_REGENERATION_FINISHED = "regeneration_finished"
+TRIGGER_DEVICE_OFFLINE = "device_offline"
+TRIGGER_DEVICE_ONLINE = "device_online"
+
+TRIGGER_TYPES = {
+    TRIGGER_ALARM_RAISED,
+    TRIGGER_ALARM_CLEARED,
+    TRIGGER_REGENERATION_STARTED,
+    TRIGGER_REGENERATION_FINISHED,
+    TRIGGER_DEVICE_OFFLINE,
+    TRIGGER_DEVICE_ONLINE,
+}
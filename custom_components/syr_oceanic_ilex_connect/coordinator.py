@@ -1,19 +1,33 @@
 """Data coordinator for Syr Oceanic i-Lex Connect."""
 
-from datetime import timedelta
+from datetime import datetime, timedelta
 import logging
 from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.const import CONF_DEVICE_ID, CONF_TYPE
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryAuthFailed
+from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.update_coordinator import (
     TimestampDataUpdateCoordinator,
     UpdateFailed,
 )
+from homeassistant.util import dt as dt_util
 
 from .api import ILexAuthError, ILexClient
-from .const import DEFAULT_SCAN_INTERVAL, DOMAIN
+from .const import (
+    DEFAULT_SCAN_INTERVAL,
+    DOMAIN,
+    EVENT_ILEX,
+    TRIGGER_ALARM_CLEARED,
+    TRIGGER_ALARM_RAISED,
+    TRIGGER_DEVICE_OFFLINE,
+    TRIGGER_DEVICE_ONLINE,
+    TRIGGER_REGENERATION_FINISHED,
+    TRIGGER_REGENERATION_STARTED,
+)
+from .scheduler import ILexRequestScheduler
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -24,7 +38,11 @@ class ILexDataUpdateCoordinator(
     """Class to manage fetching Syr Oceanic data."""
 
     def __init__(
-        self, hass: HomeAssistant, client: ILexClient, config_entry: ConfigEntry
+        self,
+        hass: HomeAssistant,
+        client: ILexClient,
+        config_entry: ConfigEntry,
+        scheduler: ILexRequestScheduler,
     ) -> None:
         """Initialize coordinator."""
         super().__init__(
@@ -35,10 +53,42 @@ class ILexDataUpdateCoordinator(
             config_entry=config_entry,
         )
         self.client = client
+        self.scheduler = scheduler
+        self.queue_wait = 0.0
+        self._previous: dict[str, dict[str, Any]] = {}
+        self._listed: set[str] = set()
+        self._online: dict[str, bool] = {}
+        self._regeneration_started: dict[str, datetime] = {}
+
+    def async_delay_next_refresh(self, delay: float) -> None:
+        """Run the next scheduled refresh after ``delay`` seconds."""
+        self.update_interval = timedelta(seconds=delay)
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Update listeners, then fire transition events for the new data.
+
+        Listeners are updated after the new data is stored, and the events
+        are fired once the entities have written their state, so automations
+        triggered by them see the matching entity states.
+        """
+        super().async_update_listeners()
+        if self.last_update_success:
+            self._async_fire_transition_events(self.data)
 
     async def _async_update_data(self) -> dict[str, dict[str, Any]]:
+        """Fetch data and line up the next poll with the assigned phase."""
+        try:
+            return await self._async_fetch_data()
+        finally:
+            self.async_delay_next_refresh(
+                self.scheduler.async_next_delay(self.config_entry.entry_id)
+            )
+
+    async def _async_fetch_data(self) -> dict[str, dict[str, Any]]:
         """Fetch data from API endpoint."""
         _LOGGER.debug("Starting data update cycle")
+        waited_before = self.client.queue_wait
         try:
             devices = await self.client.get_devices()
             _LOGGER.debug(
@@ -86,7 +136,94 @@ class ILexDataUpdateCoordinator(
                     err,
                     exc_info=True,
                 )
+        self.queue_wait = self.client.queue_wait - waited_before
         _LOGGER.debug(
-            "Data update cycle completed. Retrieved data for %d device(s)", len(data)
+            "Data update cycle completed. Retrieved data for %d device(s), "
+            "spent %.2fs waiting for request slots",
+            len(data),
+            self.queue_wait,
         )
+        self._listed = {device["serial"] for device in devices["results"]}
         return data
+
+    def _async_fire_transition_events(self, data: dict[str, dict[str, Any]]) -> None:
+        """Fire events for state changes since the last known device state.
+
+        Each device is compared with the last live data seen for it, which
+        survives cycles where its live data could not be fetched or where it
+        was offline, so a change made during such a gap is still reported.
+        """
+        now = dt_util.utcnow()
+        listed = self._listed
+
+        # The device list only contains online devices, so a device that
+        # drops out of it has gone offline.
+        for serial in set(self._online) | listed:
+            if serial in data:
+                online = data[serial]["live"].get("status") == "online"
+            elif serial in listed:
+                # Listed but live data could not be fetched, state is unknown
+                continue
+            else:
+                online = False
+            was_online = self._online.get(serial)
+            self._online[serial] = online
+            if was_online is None or was_online == online:
+                continue
+            if not online:
+                # A regeneration seen before the device dropped out cannot
+                # be timed once it comes back
+                self._regeneration_started.pop(serial, None)
+            self._async_fire_event(
+                serial, TRIGGER_DEVICE_ONLINE if online else TRIGGER_DEVICE_OFFLINE
+            )
+
+        for serial, device_data in data.items():
+            live = device_data["live"]
+            old_live = self._previous.get(serial)
+            self._previous[serial] = live
+            if old_live is None:
+                continue
+
+            old_alarm = old_live.get("current_alarm") or ""
+            alarm = live.get("current_alarm") or ""
+            if old_alarm != alarm:
+                if old_alarm:
+                    self._async_fire_event(
+                        serial, TRIGGER_ALARM_CLEARED, {"alarm": old_alarm}
+                    )
+                if alarm:
+                    self._async_fire_event(serial, TRIGGER_ALARM_RAISED, {"alarm": alarm})
+
+            regenerating = bool(live.get("regeneration"))
+            was_regenerating = bool(old_live.get("regeneration"))
+            if regenerating and not was_regenerating:
+                self._regeneration_started[serial] = now
+                self._async_fire_event(serial, TRIGGER_REGENERATION_STARTED)
+            elif was_regenerating and not regenerating:
+                started = self._regeneration_started.pop(serial, None)
+                self._async_fire_event(
+                    serial,
+                    TRIGGER_REGENERATION_FINISHED,
+                    {
+                        "duration": (now - started).total_seconds()
+                        if started is not None
+                        else None
+                    },
+                )
+
+    def _async_fire_event(
+        self, serial: str, trigger_type: str, extra: dict[str, Any] | None = None
+    ) -> None:
+        """Fire an event for a device transition."""
+        device = dr.async_get(self.hass).async_get_device(
+            identifiers={(DOMAIN, serial)}
+        )
+        event_data: dict[str, Any] = {
+            CONF_DEVICE_ID: device.id if device else None,
+            "serial": serial,
+            CONF_TYPE: trigger_type,
+            **(extra or {}),
+        }
+        _LOGGER.debug("Firing %s event: %s", EVENT_ILEX, event_data)
+        self.hass.bus.async_fire(EVENT_ILEX, event_data)
@@ -0,0 +1,33 @@
+"""Diagnostics support for Syr Oceanic i-Lex Connect."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
+from homeassistant.core import HomeAssistant
+
+if TYPE_CHECKING:
+    from . import ILexConfigEntry
+
+TO_REDACT = {CONF_PASSWORD, CONF_USERNAME}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ILexConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator = entry.runtime_data
+    scheduler = coordinator.scheduler
+    return {
+        "entry": async_redact_data(entry.as_dict(), TO_REDACT),
+        "device_count": len(coordinator.data or {}),
+        "request_queue": {
+            "last_cycle_wait": coordinator.queue_wait,
+            "total_wait": coordinator.client.queue_wait,
+            "scheduler_last_wait": scheduler.last_wait,
+            "scheduler_max_wait": scheduler.max_wait,
+            "scheduler_entries": scheduler.entry_count,
+        },
+    }
@@ -0,0 +1,143 @@
+"""Shared request scheduler for Syr Oceanic i-Lex Connect."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+import logging
+
+from homeassistant.core import HomeAssistant
+
+from .const import (
+    DEFAULT_SCAN_INTERVAL,
+    DOMAIN,
+    MAX_CONCURRENT_REQUESTS,
+    MAX_REQUESTS_PER_SECOND,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class ILexRequestScheduler:
+    """Spread polling cycles and budget requests to the i-Lex Connect cloud.
+
+    A single instance lives in ``hass.data[DOMAIN]`` and is shared by all
+    config entries, so the combined load stays within one concurrency and
+    request-rate budget however many accounts are configured.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the scheduler."""
+        self._hass = hass
+        self._interval = float(DEFAULT_SCAN_INTERVAL)
+        self._semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        self._rate_lock = asyncio.Lock()
+        self._min_spacing = 1 / MAX_REQUESTS_PER_SECOND
+        self._next_start = 0.0
+        self._holders: set[str] = set()
+        self._phases: dict[str, float] = {}
+        self.last_wait = 0.0
+        self.max_wait = 0.0
+
+    @property
+    def entry_count(self) -> int:
+        """Return the number of config entries holding the scheduler."""
+        return len(self._holders)
+
+    def async_hold(self, entry_id: str) -> None:
+        """Record that an entry uses the scheduler."""
+        self._holders.add(entry_id)
+
+    def async_release(self, entry_id: str) -> None:
+        """Forget an entry when it is unloaded or fails to set up."""
+        self._holders.discard(entry_id)
+        self._phases.pop(entry_id, None)
+
+    def async_register(self, entry_id: str) -> float:
+        """Assign an entry its polling phase and return the delay until then.
+
+        The entry is placed in the middle of the largest gap between the
+        phases assigned to the entries already registered. A lone entry
+        keeps the phase of its first refresh.
+        """
+        now = self._hass.loop.time()
+        others = sorted(
+            phase for other_id, phase in self._phases.items() if other_id != entry_id
+        )
+        if not others:
+            target = now % self._interval
+        else:
+            gaps = [
+                (
+                    (others[(idx + 1) % len(others)] - phase) % self._interval
+                    or self._interval,
+                    phase,
+                )
+                for idx, phase in enumerate(others)
+            ]
+            gap, start = max(gaps)
+            target = (start + gap / 2) % self._interval
+        self._phases[entry_id] = target
+        delay = self.async_next_delay(entry_id)
+        _LOGGER.debug(
+            "Registered entry %s next to %d other entries, next poll in %.1fs",
+            entry_id,
+            len(others),
+            delay,
+        )
+        return delay
+
+    def async_next_delay(self, entry_id: str) -> float:
+        """Return the delay until an entry's next poll at its assigned phase.
+
+        Coordinators schedule the next poll relative to the end of the
+        previous one, so the delay is recomputed after every cycle to keep
+        the phase from drifting by the cycle's duration. It is never shorter
+        than half an interval, so an entry is not polled twice in quick
+        succession. Unregistered entries use the regular interval.
+        """
+        if (target := self._phases.get(entry_id)) is None:
+            return self._interval
+        delay = (target - self._hass.loop.time()) % self._interval
+        if delay < self._interval / 2:
+            delay += self._interval
+        return delay
+
+    @asynccontextmanager
+    async def request(self) -> AsyncIterator[float]:
+        """Hold a request slot and yield how long it waited in the queue."""
+        loop = self._hass.loop
+        queued = loop.time()
+        async with self._semaphore:
+            async with self._rate_lock:
+                delay = self._next_start - loop.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                self._next_start = loop.time() + self._min_spacing
+            wait = loop.time() - queued
+            self.last_wait = wait
+            self.max_wait = max(self.max_wait, wait)
+            yield wait
+
+
+def async_get_scheduler(hass: HomeAssistant, entry_id: str) -> ILexRequestScheduler:
+    """Return the shared scheduler held by an entry, creating it on first use."""
+    domain_data: dict[str, ILexRequestScheduler] = hass.data.setdefault(DOMAIN, {})
+    if "scheduler" not in domain_data:
+        domain_data["scheduler"] = ILexRequestScheduler(hass)
+    scheduler = domain_data["scheduler"]
+    scheduler.async_hold(entry_id)
+    return scheduler
+
+
+def async_release_scheduler(hass: HomeAssistant, entry_id: str) -> None:
+    """Release an entry's hold on the scheduler, dropping it once unused."""
+    domain_data: dict[str, ILexRequestScheduler] = hass.data.get(DOMAIN, {})
+    if (scheduler := domain_data.get("scheduler")) is None:
+        return
+    scheduler.async_release(entry_id)
+    if not scheduler.entry_count:
+        del domain_data["scheduler"]
+        if not domain_data:
+            hass.data.pop(DOMAIN)